@@ -18,9 +18,11 @@
 import io
 import os
 import pathlib
+from typing import List, Tuple
 
 from ..cmake_builder import CMakeBuilder
 from ..cmake_builder import FETCH_CONTENT_DECLARE_SECTION
+from ..cmake_builder import quote_list
 from ..cmake_builder import quote_string
 from ..evaluation import EvaluationState
 from .helpers import update_target_mapping
@@ -29,6 +31,7 @@ from ..starlark.bazel_globals import BazelGlobals
 from ..starlark.bazel_globals import register_bzl_library
 from ..starlark.bazel_target import RepositoryId
 from ..starlark.invocation_context import InvocationContext
+from ..util import write_file_if_not_already_equal
 
 
 @register_bzl_library(
@@ -73,54 +76,86 @@ def _local_mirror_impl(_context: InvocationContext, **kwargs):
                                   cmake_name)
   os.makedirs(local_mirror_dir, exist_ok=True)
 
-  # Augment the CMakeLists.txt file with file(DOWNLOAD).
-  out = io.StringIO()
-  file_content = kwargs.get("file_content", {})
-  file_url = kwargs.get("file_url", {})
-  file_sha256 = kwargs.get("file_sha256", {})
+  local_mirror_posix = pathlib.PurePath(local_mirror_dir).as_posix()
 
+  # Augment the CMakeLists.txt file with file(DOWNLOAD).
+  parts: List[str] = []
+  file_content = kwargs.get("file_content") or {}
+  file_url = kwargs.get("file_url") or {}
+  file_sha256 = kwargs.get("file_sha256") or {}
+  cmakelists_prefix = kwargs.get("cmakelists_prefix")
+  cmakelists_suffix = kwargs.get("cmakelists_suffix")
+
+  # (url, path, sha256) of each file to download.
+  downloads: List[Tuple[str, str, str]] = []
   for file in files:
-    file_path = pathlib.Path(os.path.join(local_mirror_dir, file))
+    file_path = f"{local_mirror_posix}/{file}"
     content = file_content.get(file)
     if content is not None:
-      os.makedirs(file_path.parent, exist_ok=True)
-      file_path.write_text(content, encoding="utf-8")
+      write_file_if_not_already_equal(file_path, content.encode("utf-8"))
       continue
     urls = file_url.get(file)
     if not urls:
       continue
-    out.write(
-        f"file(DOWNLOAD {quote_string(urls[0])} {quote_string(str(file_path))}")
     sha256 = file_sha256.get(file)
     if not sha256:
       raise ValueError(
           f"local_mirror requires SHA256 for downloaded file: {file}")
-    out.write(f"""\n     EXPECTED_HASH "SHA256={sha256}")\n\n""")
-
-  cmaketxt_path = pathlib.Path(os.path.join(local_mirror_dir, "CMakeLists.txt"))
+    if ";" in urls[0] or ";" in file_path:
+      # The downloads are emitted as CMake lists, which are `;`-separated.
+      raise ValueError(
+          f"local_mirror does not support ';' in downloaded file: {file}")
+    downloads.append((urls[0], file_path, sha256))
+
+  # The download lists are written to a separate file and processed by a
+  # single loop.  `file(DOWNLOAD)` checks every existing file against the hash
+  # from that file: a matching file is not downloaded again, while a file
+  # whose expected hash changed is downloaded again.
+  if downloads:
+    urls, paths, sha256s = zip(*downloads)
+    sep = "\n    "
+    hashes_path = f"{local_mirror_posix}/hashes.cmake"
+    write_file_if_not_already_equal(
+        hashes_path, f"""set(_local_mirror_urls
+    {quote_list(urls, separator=sep)})
+set(_local_mirror_paths
+    {quote_list(paths, separator=sep)})
+set(_local_mirror_sha256
+    {quote_list(sha256s, separator=sep)})
+""".encode("utf-8"))
+    parts.append(f"""include({quote_string(hashes_path)})
+foreach(_lm_url _lm_path _lm_sha256 IN ZIP_LISTS _local_mirror_urls _local_mirror_paths _local_mirror_sha256)
+  file(DOWNLOAD "${{_lm_url}}" "${{_lm_path}}"
+       EXPECTED_HASH "SHA256=${{_lm_sha256}}")
+endforeach()
+
+""")
+
+  cmaketxt_path = f"{local_mirror_posix}/CMakeLists.txt"
 
   builder.addtext(
       f"# Loading {new_repository_id.repository_name}\n",
       section=FETCH_CONTENT_DECLARE_SECTION)
-  builder.addtext(out.getvalue(), section=FETCH_CONTENT_DECLARE_SECTION)
+  builder.addtext("".join(parts), section=FETCH_CONTENT_DECLARE_SECTION)
   builder.addtext(
-      f"add_subdirectory({quote_string(str(cmaketxt_path.parent))} EXCLUDE_FROM_ALL)\n",
+      f"add_subdirectory({quote_string(local_mirror_posix)} EXCLUDE_FROM_ALL)\n",
       section=FETCH_CONTENT_DECLARE_SECTION)
 
   # Now write the nested CMakeLists.txt file
   out = io.StringIO()
   out.write(f'set(CMAKE_MESSAGE_INDENT "[{cmake_name}] ")\n')
 
-  if kwargs.get("cmakelists_prefix"):
-    out.write(str(kwargs.get("cmakelists_prefix")))
+  if cmakelists_prefix:
+    out.write(str(cmakelists_prefix))
 
   write_bazel_to_cmake_cmakelists(
       _context=_context, _new_cmakelists=out, _patch_commands=[], **kwargs)
 
-  if kwargs.get("cmakelists_suffix"):
-    out.write(str(kwargs.get("cmakelists_suffix")))
+  if cmakelists_suffix:
+    out.write(str(cmakelists_suffix))
 
-  cmaketxt_path.write_text(out.getvalue(), encoding="utf-8")
+  write_file_if_not_already_equal(cmaketxt_path,
+                                  out.getvalue().encode("utf-8"))
 
   # Clients rely on find_package; provide a -config.cmake file
   # for that.
@@ -134,10 +169,10 @@ def _local_mirror_impl(_context: InvocationContext, **kwargs):
 
   config_path = os.path.join(cmake_find_package_redirects_dir,
                              f"{cmake_name.lower()}-config.cmake")
-  pathlib.Path(config_path).write_text(
+  write_file_if_not_already_equal(
+      config_path,
       f"""
 set({cmake_name.lower()}_ROOT_DIR {local_mirror_dir})
 set({cmake_name.lower()}_FOUND ON)
 set({cmake_name.upper()}_FOUND ON)
-""",
-      encoding="utf-8")
+""".encode("utf-8"))
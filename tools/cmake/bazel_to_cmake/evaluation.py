@@ -227,7 +227,7 @@ class EvaluationState:
     """
     assert isinstance(target_id, TargetId)
     assert info is not None
-    self.workspace._analyzed_targets[target_id] = info
+    self.workspace.add_analyzed_target(target_id, info)
 
   def get_optional_target_info(self,
                                target_id: TargetId) -> Optional[TargetInfo]:
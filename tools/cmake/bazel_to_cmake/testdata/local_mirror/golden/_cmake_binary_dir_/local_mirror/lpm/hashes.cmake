@@ -0,0 +1,6 @@
+set(_local_mirror_urls
+    "https://raw.githubusercontent.com/bufbuild/protoc-gen-validate/2682ad06cca00550030e177834f58a2bc06eb61e/validate/validate.proto")
+set(_local_mirror_paths
+    "_cmake_binary_dir_/local_mirror/lpm/validate.proto")
+set(_local_mirror_sha256
+    "bf7ca2ac45a75b8b9ff12f38efd7f48ee460ede1a7919d60c93fad3a64fc2eee")
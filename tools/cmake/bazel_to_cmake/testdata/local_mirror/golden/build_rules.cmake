@@ -1,6 +1,9 @@
 # Loading local_proto_mirror
-file(DOWNLOAD "https://raw.githubusercontent.com/bufbuild/protoc-gen-validate/2682ad06cca00550030e177834f58a2bc06eb61e/validate/validate.proto" "_cmake_binary_dir_/local_mirror/lpm/validate.proto"
-     EXPECTED_HASH "SHA256=bf7ca2ac45a75b8b9ff12f38efd7f48ee460ede1a7919d60c93fad3a64fc2eee")
+include("_cmake_binary_dir_/local_mirror/lpm/hashes.cmake")
+foreach(_lm_url _lm_path _lm_sha256 IN ZIP_LISTS _local_mirror_urls _local_mirror_paths _local_mirror_sha256)
+  file(DOWNLOAD "${_lm_url}" "${_lm_path}"
+       EXPECTED_HASH "SHA256=${_lm_sha256}")
+endforeach()
 
 add_subdirectory("_cmake_binary_dir_/local_mirror/lpm" EXCLUDE_FROM_ALL)
 find_package(lpm REQUIRED)
@@ -39,8 +39,13 @@ def write_file_if_not_already_equal(path: str, content: bytes):
       return
   except FileNotFoundError:
     pass
-  os.makedirs(os.path.dirname(path), exist_ok=True)
-  pathlib.Path(path).write_bytes(content)
+  try:
+    pathlib.Path(path).write_bytes(content)
+  except FileNotFoundError:
+    # Only create the parent directory if it does not already exist, to avoid
+    # redundant filesystem calls when writing many files to one directory.
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    pathlib.Path(path).write_bytes(content)
 
 
 # https://cmake.org/cmake/help/latest/command/if.html#basic-expressions
@@ -15,11 +15,9 @@
 
 # pylint: disable=missing-function-docstring,relative-beyond-top-level,g-doc-args
 
-import argparse
 import importlib
 import pathlib
 import platform
-import re
 import shlex
 from typing import Dict, List, Optional, Set, Tuple, Union
 
@@ -42,6 +40,10 @@ _PLATFORM_NAME_TO_BAZEL_PLATFORM = {
     "Linux": "linux",
 }
 
+# Prefixes of `--copt` and `--cxxopt` values from `.bazelrc` that are not
+# propagated to CMake.
+_FILTERED_COPT_PREFIXES = ("-std", "/std", "-fdiagnostics-color=", "-D", "/D")
+
 
 def _parse_bazelrc(path: str):
   options: Dict[str, List[str]] = {}
@@ -65,6 +67,23 @@ class Workspace:
   allows all `select` expressions to be fully evaluated.
   """
 
+  __slots__ = (
+      "cmake_vars",
+      "save_workspace",
+      "bazel_to_cmake_deps",
+      "repos",
+      "repo_cmake_packages",
+      "host_platform_name",
+      "values",
+      "copts",
+      "cxxopts",
+      "cdefines",
+      "ignored_libraries",
+      "_modules",
+      "_analyzed_targets",
+      "_targets_by_repo",
+  )
+
   def __init__(
       self,
       cmake_vars: Dict[str, str],
@@ -86,6 +105,8 @@ class Workspace:
     self.ignored_libraries: Set[TargetId] = set()
     self._modules: Set[str] = set()
     self._analyzed_targets: Dict[TargetId, TargetInfo] = {}
+    # Index of the keys of `_analyzed_targets` by repository.
+    self._targets_by_repo: Dict[RepositoryId, Set[TargetId]] = {}
 
   def set_bazel_target_mapping(self,
                                target: Union[str, TargetId],
@@ -101,7 +122,12 @@ class Workspace:
       providers.append(CMakePackageDepsProvider([cmake_package]))
 
     assert isinstance(target, TargetId)
-    self._analyzed_targets[target] = TargetInfo(*providers)
+    self.add_analyzed_target(target, TargetInfo(*providers))
+
+  def add_analyzed_target(self, target: TargetId, info: TargetInfo) -> None:
+    """Records the `TargetInfo` for an analyzed target."""
+    self._analyzed_targets[target] = info
+    self._targets_by_repo.setdefault(target.repository_id, set()).add(target)
 
   def ignore_library(self, target: TargetId) -> None:
     """Marks a bzl library to be ignored.
@@ -121,12 +147,8 @@ class Workspace:
     top-level project.  They must be removed in order to allow the real target
     to be analyzed.
     """
-    targets_to_delete = [
-        target for target in self._analyzed_targets
-        if target.repository_id == repository_id
-    ]
-    for target in targets_to_delete:
-      del self._analyzed_targets[target]
+    for target in self._targets_by_repo.pop(repository_id, ()):
+      self._analyzed_targets.pop(target, None)
 
   def load_bazelrc(self, path: str) -> None:
     """Loads options from a `.bazelrc` file.
@@ -145,22 +167,34 @@ class Workspace:
     if self.host_platform_name is not None:
       build_options.extend(options.get(f"build:{self.host_platform_name}", []))
 
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--copt", action="append", default=[])
-    ap.add_argument("--cxxopt", action="append", default=[])
-    ap.add_argument("--define", action="append", default=[])
-    args, _ = ap.parse_known_args(build_options)
-
-    self.values.update(("define", x) for x in args.define)
+    # Only a few options are recognized, which is simpler and much cheaper
+    # than using `argparse`.  Both `--name=value` and `--name value` forms are
+    # accepted.
+    copt: List[str] = []
+    cxxopt: List[str] = []
+    define: List[str] = []
+    recognized = {"--copt": copt, "--cxxopt": cxxopt, "--define": define}
+    it = iter(build_options)
+    for option in it:
+      name, sep, value = option.partition("=")
+      values = recognized.get(name)
+      if values is None:
+        continue
+      if not sep:
+        value = next(it, None)
+        if value is None:
+          break
+      values.append(value)
+
+    self.values.update(("define", x) for x in define)
 
     def filter_copts(opts):
       return [
-          opt for opt in opts
-          if re.match("^(?:[-/]std|-fdiagnostics-color=|[-/]D)", opt) is None
+          opt for opt in opts if not opt.startswith(_FILTERED_COPT_PREFIXES)
       ]
 
-    copts = filter_copts(args.copt)
-    cxxopts = filter_copts(args.cxxopt)
+    copts = filter_copts(copt)
+    cxxopts = filter_copts(cxxopt)
     self.copts.extend(copts)
     self.cxxopts.extend(cxxopts)
 
@@ -190,6 +224,16 @@ class Repository:
   the dependency currently being processed are present.
   """
 
+  __slots__ = (
+      "workspace",
+      "repository_id",
+      "cmake_project_name",
+      "cmake_binary_dir",
+      "source_directory",
+      "repo_mapping",
+      "top_level",
+  )
+
   def __init__(
       self,
       workspace: Workspace,
@@ -214,4 +258,5 @@ class Repository:
     workspace.repo_cmake_packages.add(cmake_project_name)
 
   def __repr__(self):
-    return f"<{self.__class__.__name__}>: {self.__dict__}"
+    attrs = {name: getattr(self, name) for name in self.__slots__}
+    return f"<{self.__class__.__name__}>: {attrs}"
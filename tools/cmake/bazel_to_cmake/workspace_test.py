@@ -0,0 +1,67 @@
+# Copyright 2022 The TensorStore Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for Workspace."""
+
+# pylint: disable=relative-beyond-top-level,protected-access
+
+from .cmake_target import CMakeTarget
+from .starlark.bazel_target import parse_absolute_target
+from .starlark.bazel_target import RepositoryId
+from .starlark.provider import TargetInfo
+from .workspace import Workspace
+
+
+def test_exclude_repo_targets():
+  workspace = Workspace({})
+  a1 = parse_absolute_target("@repo_a//:a1")
+  a2 = parse_absolute_target("@repo_a//pkg:a2")
+  b1 = parse_absolute_target("@repo_b//:b1")
+  workspace.add_analyzed_target(a1, TargetInfo())
+  workspace.set_bazel_target_mapping(a2, CMakeTarget("a::a2"))
+  workspace.set_bazel_target_mapping("@repo_b//:b1", CMakeTarget("b::b1"))
+
+  workspace.exclude_repo_targets(RepositoryId("repo_a"))
+  assert set(workspace._analyzed_targets) == {b1}
+  assert workspace._targets_by_repo == {RepositoryId("repo_b"): {b1}}
+
+  # Excluding a repository without targets has no effect.
+  workspace.exclude_repo_targets(RepositoryId("repo_a"))
+  workspace.exclude_repo_targets(RepositoryId("repo_c"))
+  assert set(workspace._analyzed_targets) == {b1}
+  assert workspace._targets_by_repo == {RepositoryId("repo_b"): {b1}}
+
+
+def test_add_bazelrc():
+  workspace = Workspace({})
+  workspace.add_bazelrc({
+      "build": [
+          "--copt=-O2",
+          "--cxxopt",
+          "-Wall",
+          "--define=a=b=c",
+          "--define",
+          "d=e",
+          "--unknown=x",
+          "--unknown",
+          "--copt=-std=c++17",
+          "--copt=/std:c++17",
+          "--copt=-DFOO",
+          "--cxxopt=/DBAR",
+          "--cxxopt=-fdiagnostics-color=always",
+          "--copt",
+      ],
+  })
+  assert workspace.copts == ["-O2"]
+  assert workspace.cxxopts == ["-Wall"]
+  assert workspace.values == {("define", "a=b=c"), ("define", "d=e")}